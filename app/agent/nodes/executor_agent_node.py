@@ -248,15 +248,23 @@ Recuerda:
         logger.warning(
             "⚠️ El Juez sugirió BUY pero ya hay posición - cambiando a HOLD por seguridad"
         )
-        decision.final_decision = "hold"
-        decision.reasoning = f"[AJUSTADO POR SEGURIDAD] {decision.reasoning}\n\nNOTA: La decisión original era BUY, pero se cambió a HOLD porque ya existe una posición abierta. Evitamos sobreexposición."
+        decision = decision.model_copy(
+            update={
+                "final_decision": "hold",
+                "reasoning": f"[AJUSTADO POR SEGURIDAD] {decision.reasoning}\n\nNOTA: La decisión original era BUY, pero se cambió a HOLD porque ya existe una posición abierta. Evitamos sobreexposición.",
+            }
+        )
 
     if decision.final_decision == "sell" and not position["has_position"]:
         logger.warning(
             "⚠️ El Juez sugirió SELL pero no hay posición - cambiando a HOLD"
         )
-        decision.final_decision = "hold"
-        decision.reasoning = f"[AJUSTADO POR SEGURIDAD] {decision.reasoning}\n\nNOTA: La decisión original era SELL, pero se cambió a HOLD porque no hay posición para vender."
+        decision = decision.model_copy(
+            update={
+                "final_decision": "hold",
+                "reasoning": f"[AJUSTADO POR SEGURIDAD] {decision.reasoning}\n\nNOTA: La decisión original era SELL, pero se cambió a HOLD porque no hay posición para vender.",
+            }
+        )
 
     # 6. Asignar resultados al estado
     state["executor_decision"] = decision.final_decision
@@ -259,7 +259,7 @@ Devuelve SOLO JSON válido."""
 
     # 4. Asignar resultados al estado
     state["skeptic_recommendation"] = critique.overall_assessment
-    state["skeptic_risks"] = critique.identified_risks
+    state["skeptic_risks"] = list(critique.identified_risks)
 
     # Construir crítica completa en texto
     risks_text = "\n".join([f"  ⚠️  {risk}" for risk in critique.identified_risks])
@@ -11,7 +11,7 @@ from app.clients.alpaca_crypto_bars_client import (
     AlpacaCryptoBarsClientError,
     alpaca_crypto_bars_client,
 )
-from app.database import AsyncSessionLocal, SupportResistanceRepository
+from app.database import AsyncReadSessionLocal, SupportResistanceRepository
 
 logger = logging.getLogger(__name__)
 
@@ -58,9 +58,10 @@ async def _get_current_price(symbol: str) -> Optional[float]:
         )
 
         # Extraer el último precio close
-        if symbol in response.bars and response.bars[symbol]:
-            latest_bar = response.bars[symbol][0]
-            return float(latest_bar.c)  # Close price
+        bars = response["bars"].get(symbol)
+        if bars:
+            latest_bar = bars[0]
+            return float(latest_bar["c"])  # Close price
 
         return None
 
@@ -104,8 +105,8 @@ async def support_resistance_node(state: AgentState) -> AgentState:
     state["current_price"] = current_price
     logger.info(f"Precio actual de {symbol}: ${current_price:,.2f}")
 
-    # 2. Consultar zonas desde la base de datos
-    async with AsyncSessionLocal() as session:
+    # 2. Consultar zonas desde la base de datos (pool de lectura)
+    async with AsyncReadSessionLocal() as session:
         repo = SupportResistanceRepository(session)
 
         # Obtener soportes y resistencias (últimas 50 de cada tipo)
@@ -5,8 +5,10 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.config.settings import settings
-
-from app.models.alpaca_crypto_bars_models import AlpacaCryptoBarsResponse
+from app.models.alpaca_crypto_bars_models import (
+    BARS_RESPONSE_ADAPTER,
+    AlpacaCryptoBarsData,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +63,7 @@ class AlpacaCryptoBarsClient:
         end: datetime,
         limit: Optional[int] = None,
         sort: Optional[str] = None,
-    ) -> AlpacaCryptoBarsResponse:
+    ) -> AlpacaCryptoBarsData:
         """Obtiene barras de cripto desde la API de Alpaca.
 
         Args:
@@ -73,7 +75,7 @@ class AlpacaCryptoBarsClient:
             sort: Orden de los resultados ("asc" o "desc").
 
         Returns:
-            AlpacaCryptoBarsResponse: Respuesta tipada con las barras por símbolo.
+            AlpacaCryptoBarsData: Respuesta tipada (dicts planos) con las barras por símbolo.
 
         Raises:
             AlpacaCryptoBarsClientError: Si ocurre un error HTTP o de red.
@@ -111,8 +113,7 @@ class AlpacaCryptoBarsClient:
                 "Error de red al llamar a Alpaca Crypto Bars"
             ) from exc
 
-        data = response.json()
-        return AlpacaCryptoBarsResponse.model_validate(data)
+        return BARS_RESPONSE_ADAPTER.validate_json(response.content)
 
 
 alpaca_crypto_bars_client = AlpacaCryptoBarsClient()
@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.config.settings import settings
-from app.models.alpaca_news_models import AlpacaNewsResponse
+from app.models.alpaca_news_models import AlpacaNewsResponse, news_response_decoder
 
 logger = logging.getLogger(__name__)
 
@@ -113,8 +113,7 @@ class AlpacaNewsClient:
             logger.error("Error de red al llamar a Alpaca News: %s", str(exc))
             raise AlpacaNewsClientError("Error de red al llamar a Alpaca News") from exc
 
-        data = response.json()
-        return AlpacaNewsResponse.model_validate(data)
+        return news_response_decoder.decode(response.content)
 
 
 alpaca_news_client = AlpacaNewsClient()
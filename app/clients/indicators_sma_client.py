@@ -111,7 +111,7 @@ class SimpleMovingAverageClient:
             raise IndicatorClientError("Error de red al llamar a SMA") from exc
 
         data = response.json()
-        return IndicatorResponse.model_validate(data)
+        return IndicatorResponse.from_api(data)
 
 
 sma_client = SimpleMovingAverageClient()
@@ -9,6 +9,18 @@ class Settings:
     """Aplicación principal y configuración de clientes externos (Alpaca, etc.)."""
 
     app_name: str = "SuperBotV2"
+    # Ejemplos en los JSON schemas de los modelos (solo útiles para /docs)
+    enable_openapi_examples: bool = os.getenv("ENABLE_OPENAPI_EXAMPLES", "true").lower() == "true"
+    # Scheduler de análisis automático: debe correr en un único proceso (con
+    # varios workers de uvicorn, habilitarlo solo en uno)
+    scheduler_enabled: bool = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+    # Orígenes permitidos por CORS (separados por coma). Lista fija: con
+    # credenciales el comodín "*" no es válido para los navegadores
+    cors_allow_origins: tuple[str, ...] = tuple(
+        origin.strip()
+        for origin in os.getenv("CORS_ALLOW_ORIGINS", "http://localhost:3000,http://localhost:8000").split(",")
+        if origin.strip()
+    )
 
     # Alpaca News API
     alpaca_news_base_url: str = "https://data.alpaca.markets"
@@ -49,6 +61,11 @@ class Settings:
     mysql_max_overflow: int = 10
     mysql_pool_timeout: float = 30.0
     mysql_pool_recycle: int = 3600  # Recycle connections after 1 hour
+    # Pool de solo lectura (consultas de zonas S/R): dimensionado por CPU y con
+    # timeout corto para que la saturación se detecte rápido
+    mysql_read_pool_size: int = max(2, (os.cpu_count() or 1) * 2)
+    mysql_read_max_overflow: int = 5
+    mysql_read_pool_timeout: float = 2.0
 
     # AWS SES Email Configuration
     aws_ses_host: str = "email-smtp.us-east-1.amazonaws.com"
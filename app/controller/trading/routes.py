@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from app.agent.graph.trading_graph import  run_trading_analysis
 from app.controller.trading.schemas import TradingAnalysisRequest, TradingAnalysisResponse
@@ -14,6 +14,21 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/trading", tags=["trading"])
 
 
+def _json_response(model: TradingAnalysisResponse) -> Response:
+    """Serializa la respuesta con el serializador nativo de Pydantic.
+
+    Evita el paso por `jsonable_encoder` + `json` estándar de FastAPI; el
+    `response_model` del endpoint se mantiene para la documentación OpenAPI.
+
+    Args:
+        model: Respuesta ya construida y validada.
+
+    Returns:
+        Response: JSON listo para enviar.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @router.post(
     "/analyze",
     response_model=TradingAnalysisResponse,
@@ -32,14 +47,14 @@ router = APIRouter(prefix="/api/trading", tags=["trading"])
     Los pasos 1-4 se ejecutan en paralelo para optimizar tiempo.
     """,
 )
-async def analyze_trading(request: TradingAnalysisRequest) -> TradingAnalysisResponse:
+async def analyze_trading(request: TradingAnalysisRequest) -> Response:
     """Ejecuta el análisis completo de trading.
 
     Args:
         request: Parámetros del análisis (símbolos y límite de noticias).
 
     Returns:
-        TradingAnalysisResponse: Resultados completos del análisis.
+        Response: JSON de `TradingAnalysisResponse` con los resultados del análisis.
 
     Raises:
         HTTPException: Si ocurre un error durante el análisis.
@@ -56,10 +71,12 @@ async def analyze_trading(request: TradingAnalysisRequest) -> TradingAnalysisRes
         # Verificar si hubo error
         if final_state.get("error_message"):
             logger.error(f"Error en análisis: {final_state['error_message']}")
-            return TradingAnalysisResponse(
-                success=False,
-                symbols=request.symbols,
-                error_message=final_state["error_message"],
+            return _json_response(
+                TradingAnalysisResponse(
+                    success=False,
+                    symbols=request.symbols,
+                    error_message=final_state["error_message"],
+                )
             )
 
         # Construir response con todos los resultados
@@ -90,6 +107,12 @@ async def analyze_trading(request: TradingAnalysisRequest) -> TradingAnalysisRes
             },
             strategist_proposal={
                 "direction": final_state.get("strategist_direction"),
+                # El estado no expone estos niveles: se envían como null para
+                # mantener el formato de respuesta
+                "entry_price": None,
+                "stop_loss": None,
+                "take_profit": None,
+                "risk_reward_ratio": None,
                 "justification": final_state.get("strategist_justification"),
                 "proposal_text": final_state.get("strategist_proposal"),
             },
@@ -109,7 +132,7 @@ async def analyze_trading(request: TradingAnalysisRequest) -> TradingAnalysisRes
         )
 
         logger.info(f"Análisis completado exitosamente para {request.symbols}")
-        return response
+        return _json_response(response)
 
     except Exception as exc:
         logger.error(f"Error ejecutando análisis de trading: {exc}", exc_info=True)
@@ -150,20 +173,24 @@ async def health_check() -> dict:
     - Próxima ejecución de cada job
     """,
 )
-async def scheduler_status() -> dict:
+async def scheduler_status(request: Request) -> dict:
     """Consulta el estado del scheduler.
 
+    Args:
+        request: Request actual (el scheduler vive en `app.state.scheduler`).
+
     Returns:
         dict: Estado del scheduler y jobs programados.
     """
-    status = get_scheduler_status()
+    scheduler = request.app.state.scheduler
+    scheduler_state = scheduler.status()
 
     return {
-        "scheduler_active": status["running"],
-        "scheduled_jobs": status["jobs"],
+        "scheduler_active": scheduler_state["running"],
+        "scheduled_jobs": scheduler_state["jobs"],
         "config": {
-            "symbols": ["BTCUSD"],
-            "news_limit": 10,
+            "symbols": scheduler.symbols,
+            "news_limit": scheduler.news_limit,
             "schedule": [
                 {"time": "09:00", "description": "Análisis matutino"},
                 {"time": "18:00", "description": "Análisis vespertino"},
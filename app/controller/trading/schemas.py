@@ -2,10 +2,60 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, TypedDict
 
 from pydantic import BaseModel, Field
 
+# Ejemplos para OpenAPI definidos una sola vez a nivel de módulo
+_TRADING_ANALYSIS_REQUEST_EXAMPLE = {
+    "symbols": ["BTCUSD"],
+    "news_limit": 10,
+}
+
+_TRADING_ANALYSIS_RESPONSE_EXAMPLE = {
+    "success": True,
+    "symbols": ["BTCUSD"],
+    "error_message": None,
+    "news_analysis": {
+        "sentiment": "positive",
+        "context_summary": "Aprobación de ETF impulsa demanda...",
+        "market_opinion": "Contexto favorable para alcistas...",
+    },
+    "technical_analysis": {
+        "trend_analysis": "SMA 25 > SMA 200, tendencia alcista",
+        "crossover_status": "golden_cross",
+        "momentum": "bullish",
+        "conclusion": "Estructura alcista confirmada",
+    },
+    "fear_greed": {"index": 75, "classification": "Greed"},
+    "support_resistance": {
+        "nearest_support": 95000.0,
+        "distance_to_support": "-1.5%",
+        "nearest_resistance": 98000.0,
+        "distance_to_resistance": "+1.5%",
+    },
+    "strategist_proposal": {
+        "direction": "buy",
+        "justification": "Confluencia de señales alcistas...",
+    },
+    "skeptic_critique": {
+        "overall_assessment": "proceed_with_caution",
+        "critique_text": "Si bien hay señales alcistas, existen riesgos...",
+        "identified_risks": [
+            "Fear & Greed cerca de zona extrema",
+            "Precio en zona alta del rango",
+            "Posible trampa alcista",
+        ],
+    },
+    "executor_decision": {
+        "final_decision": "hold",
+        "reasoning": "Considerando ambos argumentos y la posición actual...",
+        "risk_assessment": "medium",
+        "confidence_level": "high",
+        "has_current_position": True,
+    },
+}
+
 
 class TradingAnalysisRequest(BaseModel):
     """Request para iniciar análisis de trading."""
@@ -23,61 +73,56 @@ class TradingAnalysisRequest(BaseModel):
         description="Número de noticias a analizar",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "symbols": ["BTCUSD"],
-                    "news_limit": 10,
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_TRADING_ANALYSIS_REQUEST_EXAMPLE]}}
+
+
+# Los resultados parciales son contenedores planos que solo dan forma al JSON:
+# se declaran como TypedDict para evitar construir un modelo Pydantic por cada uno.
 
 
-class NewsAnalysisResult(BaseModel):
+class NewsAnalysisResult(TypedDict, total=False):
     """Resultado del análisis de noticias."""
 
-    sentiment: Optional[str] = None
-    context_summary: Optional[str] = None
-    market_opinion: Optional[str] = None
+    sentiment: Optional[str]
+    context_summary: Optional[str]
+    market_opinion: Optional[str]
 
 
-class TechnicalAnalysisResult(BaseModel):
+class TechnicalAnalysisResult(TypedDict, total=False):
     """Resultado del análisis técnico."""
 
-    trend_analysis: Optional[str] = None
-    crossover_status: Optional[str] = None
-    momentum: Optional[str] = None
-    conclusion: Optional[str] = None
+    trend_analysis: Optional[str]
+    crossover_status: Optional[str]
+    momentum: Optional[str]
+    conclusion: Optional[str]
 
 
-class FearGreedResult(BaseModel):
+class FearGreedResult(TypedDict, total=False):
     """Resultado del Fear & Greed Index."""
 
-    index: Optional[int] = None
-    classification: Optional[str] = None
+    index: Optional[int]
+    classification: Optional[str]
 
 
-class SupportResistanceResult(BaseModel):
+class SupportResistanceResult(TypedDict, total=False):
     """Resultado del análisis de soporte/resistencia."""
 
-    nearest_support: Optional[float] = None
-    distance_to_support: Optional[str] = None
-    nearest_resistance: Optional[float] = None
-    distance_to_resistance: Optional[str] = None
+    nearest_support: Optional[float]
+    distance_to_support: Optional[str]
+    nearest_resistance: Optional[float]
+    distance_to_resistance: Optional[str]
 
 
-class StrategistProposalResult(BaseModel):
+class StrategistProposalResult(TypedDict, total=False):
     """Resultado de la propuesta del Estratega."""
 
-    direction: Optional[str] = None
-    entry_price: Optional[float] = None
-    stop_loss: Optional[float] = None
-    take_profit: Optional[float] = None
-    risk_reward_ratio: Optional[str] = None
-    justification: Optional[str] = None
-    proposal_text: Optional[str] = None
+    direction: Optional[str]
+    entry_price: Optional[float]
+    stop_loss: Optional[float]
+    take_profit: Optional[float]
+    risk_reward_ratio: Optional[str]
+    justification: Optional[str]
+    proposal_text: Optional[str]
 
 
 class TradingAnalysisResponse(BaseModel):
@@ -94,54 +139,4 @@ class TradingAnalysisResponse(BaseModel):
     support_resistance: Optional[SupportResistanceResult] = None
     strategist_proposal: Optional[StrategistProposalResult] = None
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "success": True,
-                    "symbols": ["BTCUSD"],
-                    "error_message": None,
-                    "news_analysis": {
-                        "sentiment": "positive",
-                        "context_summary": "Aprobación de ETF impulsa demanda...",
-                        "market_opinion": "Contexto favorable para alcistas...",
-                    },
-                    "technical_analysis": {
-                        "trend_analysis": "SMA 25 > SMA 200, tendencia alcista",
-                        "crossover_status": "golden_cross",
-                        "momentum": "bullish",
-                        "conclusion": "Estructura alcista confirmada",
-                    },
-                    "fear_greed": {"index": 75, "classification": "Greed"},
-                    "support_resistance": {
-                        "nearest_support": 95000.0,
-                        "distance_to_support": "-1.5%",
-                        "nearest_resistance": 98000.0,
-                        "distance_to_resistance": "+1.5%",
-                    },
-                    "strategist_proposal": {
-                        "direction": "buy",
-                        "justification": "Confluencia de señales alcistas...",
-                    },
-                    "skeptic_critique": {
-                        "overall_assessment": "proceed_with_caution",
-                        "critique_text": "Si bien hay señales alcistas, existen riesgos...",
-                        "identified_risks": [
-                            "Fear & Greed cerca de zona extrema",
-                            "Precio en zona alta del rango",
-                            "Posible trampa alcista",
-                        ],
-                    },
-                    "executor_decision": {
-                        "final_decision": "hold",
-                        "reasoning": "Considerando ambos argumentos y la posición actual...",
-                        "risk_assessment": "medium",
-                        "confidence_level": "high",
-                        "has_current_position": True,
-                    },
-                }
-            ]
-        }
-    }
-
-
+    model_config = {"json_schema_extra": {"examples": [_TRADING_ANALYSIS_RESPONSE_EXAMPLE]}}
@@ -1,10 +1,13 @@
 """Paquete de base de datos (MySQL async)."""
 
 from app.database.connection import (
+    AsyncReadSessionLocal,
     AsyncSessionLocal,
     close_db_connections,
     get_async_engine,
     get_db_session,
+    get_read_engine,
+    warmup_db_pools,
 )
 from app.database.repository import SupportResistanceRepository
 from app.database.transaction_repository import (
@@ -15,6 +18,7 @@ from app.database.transaction_repository import (
 from app.models.database_models import Base, SupportResistanceZone, Transaction
 
 __all__ = [
+    "AsyncReadSessionLocal",
     "AsyncSessionLocal",
     "Base",
     "InsufficientFundsError",
@@ -26,5 +30,7 @@ __all__ = [
     "close_db_connections",
     "get_async_engine",
     "get_db_session",
+    "get_read_engine",
+    "warmup_db_pools",
 ]
 
@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 from typing import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -18,27 +19,32 @@ from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Motor async singleton (se crea una sola vez)
+# Motores async singleton (se crean una sola vez)
 _async_engine: AsyncEngine | None = None
+_read_engine: AsyncEngine | None = None
+
+
+def _database_url() -> str:
+    """Construye la URL de conexión MySQL async a partir de settings."""
+    return (
+        f"mysql+aiomysql://{settings.mysql_user}:{settings.mysql_password}"
+        f"@{settings.mysql_host}:{settings.mysql_port}/{settings.mysql_database}"
+    )
 
 
 def get_async_engine() -> AsyncEngine:
     """Devuelve el motor async de SQLAlchemy (singleton).
 
+    Usado para transacciones de escritura (compras/ventas, altas de zonas).
+
     Returns:
         AsyncEngine: Motor configurado con connection pooling.
     """
     global _async_engine
 
     if _async_engine is None:
-        # Construir URL de conexión MySQL async
-        database_url = (
-            f"mysql+aiomysql://{settings.mysql_user}:{settings.mysql_password}"
-            f"@{settings.mysql_host}:{settings.mysql_port}/{settings.mysql_database}"
-        )
-
         _async_engine = create_async_engine(
-            database_url,
+            _database_url(),
             pool_size=settings.mysql_pool_size,
             max_overflow=settings.mysql_max_overflow,
             pool_timeout=settings.mysql_pool_timeout,
@@ -54,6 +60,35 @@ def get_async_engine() -> AsyncEngine:
     return _async_engine
 
 
+def get_read_engine() -> AsyncEngine:
+    """Devuelve el motor async de solo lectura (singleton).
+
+    Comparte URL con el motor de escritura pero usa su propio pool, para que
+    las consultas de lectura no compitan con las transacciones de trading.
+
+    Returns:
+        AsyncEngine: Motor de lectura con connection pooling.
+    """
+    global _read_engine
+
+    if _read_engine is None:
+        _read_engine = create_async_engine(
+            _database_url(),
+            pool_size=settings.mysql_read_pool_size,
+            max_overflow=settings.mysql_read_max_overflow,
+            pool_timeout=settings.mysql_read_pool_timeout,
+            pool_recycle=settings.mysql_pool_recycle,
+            pool_pre_ping=True,
+            echo=False,
+        )
+
+        logger.info(
+            f"Motor de lectura async creado (pool_size={settings.mysql_read_pool_size})"
+        )
+
+    return _read_engine
+
+
 # Session factory async
 AsyncSessionLocal = sessionmaker(
     bind=get_async_engine(),
@@ -63,6 +98,15 @@ AsyncSessionLocal = sessionmaker(
     autoflush=False,
 )
 
+# Session factory async de solo lectura
+AsyncReadSessionLocal = sessionmaker(
+    bind=get_read_engine(),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency para obtener una sesión de base de datos async.
@@ -86,15 +130,33 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def warmup_db_pools() -> None:
+    """Abre una conexión en cada pool (escritura y lectura) al arrancar.
+
+    Así el primer análisis no paga el handshake TCP/TLS + autenticación de
+    MySQL; la conexión queda en el pool para ser reutilizada.
+    """
+    for engine in (get_async_engine(), get_read_engine()):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    logger.info("Pools de base de datos precalentados")
+
+
 async def close_db_connections() -> None:
     """Cierra todas las conexiones del pool.
 
     Llamar en el shutdown de la aplicación FastAPI.
     """
-    global _async_engine
+    global _async_engine, _read_engine
 
     if _async_engine is not None:
         await _async_engine.dispose()
         logger.info("Conexiones de base de datos cerradas")
         _async_engine = None
 
+    if _read_engine is not None:
+        await _read_engine.dispose()
+        logger.info("Conexiones de lectura cerradas")
+        _read_engine = None
+
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.database_models import SupportResistanceZone
@@ -55,12 +55,12 @@ class SupportResistanceRepository:
             price=price,
             strength=strength,
             description=description,
-            created_at=datetime.utcnow(),
+            created_at=datetime.now(timezone.utc),
         )
 
+        # flush asigna el ID autoincremental; el resto de campos ya está en memoria
         self.session.add(zone)
         await self.session.flush()
-        await self.session.refresh(zone)
 
         logger.info(f"Zona creada: {zone}")
         return zone
@@ -74,8 +74,13 @@ class SupportResistanceRepository:
         Returns:
             SupportResistanceZone o None si no existe.
         """
+        # lambda_stmt: SQL compilado cacheado, solo se re-enlaza zone_id
         result = await self.session.execute(
-            select(SupportResistanceZone).where(SupportResistanceZone.id == zone_id)
+            lambda_stmt(
+                lambda: select(SupportResistanceZone).where(
+                    SupportResistanceZone.id == zone_id
+                )
+            )
         )
         return result.scalar_one_or_none()
 
@@ -132,11 +137,12 @@ class SupportResistanceRepository:
         Returns:
             True si se eliminó, False si no existía.
         """
-        zone = await self.get_by_id(zone_id)
-        if zone is None:
+        result = await self.session.execute(
+            delete(SupportResistanceZone).where(SupportResistanceZone.id == zone_id)
+        )
+        if result.rowcount == 0:
             return False
 
-        await self.session.delete(zone)
         logger.info(f"Zona eliminada: {zone_id}")
         return True
 
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, case, func, insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.database_models import Transaction
@@ -41,6 +40,9 @@ class TransactionRepository:
         """
         self.session = session
 
+    # Las queries de los hot paths usan `lambda_stmt`: SQLAlchemy cachea el SQL
+    # compilado por la ubicación de la lambda y solo re-enlaza los parámetros.
+
     async def get_available_balance(self) -> float:
         """Obtiene el balance disponible en USD.
 
@@ -48,10 +50,12 @@ class TransactionRepository:
             float: Balance disponible (última transacción o 10000 por defecto).
         """
         result = await self.session.execute(
-            select(Transaction.available_usd)
-            .where(Transaction.available_usd.isnot(None))
-            .order_by(Transaction.created_at.desc())
-            .limit(1)
+            lambda_stmt(
+                lambda: select(Transaction.available_usd)
+                .where(Transaction.available_usd.isnot(None))
+                .order_by(Transaction.created_at.desc())
+                .limit(1)
+            )
         )
         balance = result.scalar_one_or_none()
         return float(balance) if balance else 10000.0  # Default: $10,000
@@ -67,22 +71,67 @@ class TransactionRepository:
         """
         # Sumar todas las compras
         result_buys = await self.session.execute(
-            select(func.sum(Transaction.quantity)).where(
-                Transaction.symbol == symbol, Transaction.action == "buy"
+            lambda_stmt(
+                lambda: select(func.sum(Transaction.quantity)).where(
+                    Transaction.symbol == symbol, Transaction.action == "buy"
+                )
             )
         )
-        total_buys = result_buys.scalar_one_or_none() or Decimal(0)
+        total_buys = result_buys.scalar_one_or_none() or 0.0
 
         # Restar todas las ventas
         result_sells = await self.session.execute(
-            select(func.sum(Transaction.quantity)).where(
-                Transaction.symbol == symbol, Transaction.action == "sell"
+            lambda_stmt(
+                lambda: select(func.sum(Transaction.quantity)).where(
+                    Transaction.symbol == symbol, Transaction.action == "sell"
+                )
             )
         )
-        total_sells = result_sells.scalar_one_or_none() or Decimal(0)
+        total_sells = result_sells.scalar_one_or_none() or 0.0
 
         return float(total_buys - total_sells)
 
+    async def _get_balance_and_position(self, symbol: str) -> tuple[float, float]:
+        """Obtiene balance disponible y cantidad de un símbolo en una sola query.
+
+        Equivale a `get_available_balance` + `get_position_quantity`, pero con
+        un único round-trip (dos subqueries escalares en el mismo SELECT).
+
+        Args:
+            symbol: Símbolo del activo.
+
+        Returns:
+            tuple: (balance disponible en USD, cantidad disponible del símbolo).
+        """
+        balance_sq = (
+            select(Transaction.available_usd)
+            .where(Transaction.available_usd.isnot(None))
+            .order_by(Transaction.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        position_sq = (
+            select(
+                func.sum(
+                    case(
+                        (Transaction.action == "buy", Transaction.quantity),
+                        else_=-Transaction.quantity,
+                    )
+                )
+            )
+            .where(Transaction.symbol == symbol)
+            .scalar_subquery()
+        )
+
+        result = await self.session.execute(
+            select(balance_sq.label("available_usd"), position_sq.label("quantity"))
+        )
+        row = result.one()
+
+        balance = float(row.available_usd) if row.available_usd else 10000.0  # Default: $10,000
+        quantity = float(row.quantity) if row.quantity else 0.0
+        return balance, quantity
+
     async def get_average_buy_price(self, symbol: str) -> Optional[float]:
         """Calcula el precio promedio de compra de un símbolo.
 
@@ -103,7 +152,7 @@ class TransactionRepository:
         if not row or not row.total_quantity or row.total_quantity == 0:
             return None
 
-        return float(row.total_cost / row.total_quantity)
+        return float(row.total_cost) / float(row.total_quantity)
 
     async def calculate_portfolio_value(self, current_prices: Dict[str, float]) -> float:
         """Calcula el valor total del portfolio.
@@ -150,7 +199,7 @@ class TransactionRepository:
             InsufficientFundsError: Si no hay fondos suficientes.
         """
         total_cost = quantity * price
-        available_usd = await self.get_available_balance()
+        available_usd, position_quantity = await self._get_balance_and_position(symbol)
 
         if total_cost > available_usd:
             raise InsufficientFundsError(
@@ -160,7 +209,9 @@ class TransactionRepository:
 
         # Calcular nuevos valores
         new_available_usd = available_usd - total_cost
-        portfolio_value = await self.calculate_portfolio_value({symbol: price})
+        portfolio_value = available_usd
+        if position_quantity > 0:
+            portfolio_value += position_quantity * price
         portfolio_value += total_cost  # Agregar la nueva compra
 
         # Crear transacción
@@ -178,9 +229,9 @@ class TransactionRepository:
             agent_name=agent_name,
         )
 
+        # flush asigna el ID autoincremental; el resto de campos ya está en memoria
         self.session.add(transaction)
         await self.session.flush()
-        await self.session.refresh(transaction)
 
         logger.info(
             f"COMPRA ejecutada: {quantity:.8f} {symbol} @ ${price:,.2f} "
@@ -213,7 +264,7 @@ class TransactionRepository:
         Raises:
             InsufficientQuantityError: Si no hay cantidad suficiente.
         """
-        available_quantity = await self.get_position_quantity(symbol)
+        available_usd, available_quantity = await self._get_balance_and_position(symbol)
 
         if quantity > available_quantity:
             raise InsufficientQuantityError(
@@ -223,7 +274,6 @@ class TransactionRepository:
 
         # Calcular valores
         total_revenue = quantity * price
-        available_usd = await self.get_available_balance()
         new_available_usd = available_usd + total_revenue
 
         # Calcular PnL
@@ -232,8 +282,10 @@ class TransactionRepository:
         if avg_buy_price is not None:
             pnl = (price - avg_buy_price) * quantity
 
-        # Portfolio value
-        portfolio_value = await self.calculate_portfolio_value({symbol: price})
+        # Portfolio value (balance + posición previa a la venta)
+        portfolio_value = available_usd
+        if available_quantity > 0:
+            portfolio_value += available_quantity * price
 
         # Crear transacción
         transaction = Transaction(
@@ -250,9 +302,9 @@ class TransactionRepository:
             agent_name=agent_name,
         )
 
+        # flush asigna el ID autoincremental; el resto de campos ya está en memoria
         self.session.add(transaction)
         await self.session.flush()
-        await self.session.refresh(transaction)
 
         pnl_str = f"PnL: ${pnl:,.2f}" if pnl else "PnL: N/A"
         logger.info(
@@ -262,6 +314,26 @@ class TransactionRepository:
 
         return transaction
 
+    async def bulk_insert(self, rows: List[Dict[str, Any]]) -> int:
+        """Inserta muchas transacciones en un único `executemany` (Core, sin ORM).
+
+        Pensado para backfills o ráfagas: no valida fondos/cantidades ni crea
+        objetos `Transaction`. `created_at` lo completa MySQL (UTC_TIMESTAMP) si se omite.
+
+        Args:
+            rows: Dicts con las columnas de `transactions` (symbol, action, ...).
+
+        Returns:
+            int: Número de filas insertadas.
+        """
+        if not rows:
+            return 0
+
+        await self.session.execute(insert(Transaction.__table__), rows)
+
+        logger.info(f"Insertadas {len(rows)} transacciones en bloque")
+        return len(rows)
+
     async def get_all_transactions(
         self, *, limit: int = 100, symbol: Optional[str] = None
     ) -> List[Transaction]:
@@ -274,13 +346,41 @@ class TransactionRepository:
         Returns:
             Lista de transacciones.
         """
+        result = await self.session.execute(
+            self._transactions_query(limit=limit, symbol=symbol)
+        )
+        return result.scalars().all()
+
+    async def stream_transactions(
+        self, *, limit: int = 100, symbol: Optional[str] = None
+    ) -> AsyncIterator[Transaction]:
+        """Itera las últimas transacciones a medida que llegan del servidor.
+
+        Usa un cursor del lado del servidor para no materializar el resultado
+        completo en memoria (útil para exportaciones con `limit` grande).
+
+        Args:
+            limit: Número máximo de resultados.
+            symbol: Filtrar por símbolo (opcional).
+
+        Yields:
+            Transaction: Transacciones ordenadas por fecha desc.
+        """
+        result = await self.session.stream(
+            self._transactions_query(limit=limit, symbol=symbol)
+        )
+        async for transaction in result.scalars():
+            yield transaction
+
+    @staticmethod
+    def _transactions_query(*, limit: int, symbol: Optional[str]) -> Select:
+        """Construye la query de últimas transacciones, opcionalmente por símbolo."""
         query = select(Transaction).order_by(Transaction.created_at.desc()).limit(limit)
 
         if symbol:
             query = query.where(Transaction.symbol == symbol)
 
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return query
 
     async def get_transaction_by_id(self, transaction_id: int) -> Optional[Transaction]:
         """Obtiene una transacción por ID.
@@ -339,6 +439,7 @@ class TransactionRepository:
             select(
                 func.sum(Transaction.pnl).label("total_pnl"),
                 func.count(Transaction.id).label("num_trades"),
+                func.avg(Transaction.pnl).label("avg_pnl"),
             ).where(
                 Transaction.action == "sell",
                 Transaction.created_at >= cutoff_date,
@@ -349,11 +450,12 @@ class TransactionRepository:
 
         total_pnl = float(row.total_pnl) if row and row.total_pnl else 0.0
         num_trades = int(row.num_trades) if row and row.num_trades else 0
+        avg_pnl = float(row.avg_pnl) if row and row.avg_pnl else 0.0
 
         return {
             "period_days": days,
             "total_pnl": total_pnl,
             "num_trades": num_trades,
-            "avg_pnl_per_trade": total_pnl / num_trades if num_trades > 0 else 0.0,
+            "avg_pnl_per_trade": avg_pnl,
         }
 
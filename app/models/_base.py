@@ -0,0 +1,14 @@
+"""Base común para los modelos Pydantic del paquete `app.models`."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class FastModel(BaseModel):
+    """BaseModel con configuración compartida por todos los modelos.
+
+    `defer_build=True` pospone la construcción del core schema hasta la primera
+    validación/serialización, así importar los modelos no paga ese costo.
+    Las subclases pueden extender `model_config`; Pydantic lo combina con este.
+    """
+
+    model_config = ConfigDict(defer_build=True, extra="ignore")
@@ -0,0 +1,35 @@
+"""Ejemplos de payloads para la documentación OpenAPI de los modelos de APIs externas.
+
+Solo se importa cuando `settings.enable_openapi_examples` está activo
+(ver `app.models._openapi.openapi_examples`).
+"""
+
+# Polygon Indicators (SMA)
+INDICATOR_VALUE = {"timestamp": 1766534400000, "value": 107716.27114999991}
+
+INDICATOR_RESULTS = {
+    "underlying": {
+        "url": "https://api.polygon.io/v2/aggs/ticker/X:BTCUSD/range/1/day/1483246800000/1766696751877?limit=894&sort=desc"
+    },
+    "values": [INDICATOR_VALUE],
+}
+
+INDICATOR_RESPONSE = {
+    "results": INDICATOR_RESULTS,
+    "status": "OK",
+    "request_id": "a16d479046da5eb609d9f698453ea6e2",
+    "next_url": "https://api.polygon.io/v1/indicators/sma/X:BTCUSD?cursor=...",
+}
+
+# Alternative.me Fear & Greed
+FEAR_GREED_VALUE = {
+    "value": 74,
+    "value_classification": "Greed",
+    "timestamp": "1766534400",
+    "time_until_update": "86400",
+}
+
+FEAR_GREED_RESPONSE = {
+    "name": "Crypto Fear and Greed Index",
+    "data": [FEAR_GREED_VALUE],
+}
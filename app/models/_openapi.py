@@ -0,0 +1,25 @@
+"""Helper para adjuntar ejemplos OpenAPI a los modelos solo cuando están habilitados."""
+
+from typing import Any, Dict
+
+from app.config.settings import settings
+
+
+def openapi_examples(name: str) -> Dict[str, Any]:
+    """Devuelve la entrada `json_schema_extra` con el ejemplo `name` de `_examples`.
+
+    Con `settings.enable_openapi_examples` desactivado devuelve `{}` y el
+    módulo de ejemplos ni siquiera se importa.
+
+    Args:
+        name: Nombre de la constante en `app.models._examples`.
+
+    Returns:
+        Dict listo para expandir dentro de `model_config`.
+    """
+    if not settings.enable_openapi_examples:
+        return {}
+
+    from app.models import _examples
+
+    return {"json_schema_extra": {"examples": [getattr(_examples, name)]}}
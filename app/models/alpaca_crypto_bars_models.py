@@ -1,73 +1,35 @@
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import TypeAdapter
 
 
-class AlpacaCryptoBar(BaseModel):
-    """Barra de precio de cripto devuelta por Alpaca.
+class AlpacaCryptoBarData(TypedDict):
+    """Barra de precio de cripto devuelta por Alpaca, como dict plano.
 
     Los campos siguen la convención de la API v1beta3 de Alpaca.
     """
 
-    o: float = Field(..., description="Precio de apertura (open)")
-    h: float = Field(..., description="Precio máximo (high)")
-    l: float = Field(..., description="Precio mínimo (low)")
-    c: float = Field(..., description="Precio de cierre (close)")
-    v: float = Field(..., description="Volumen negociado")
-    n: int = Field(..., description="Número de operaciones en el periodo")
-    vw: float = Field(..., description="Precio medio ponderado por volumen (VWAP)")
-    t: datetime = Field(..., description="Fecha/hora del bar en formato ISO 8601")
+    o: float  # Precio de apertura (open)
+    h: float  # Precio máximo (high)
+    l: float  # Precio mínimo (low)
+    c: float  # Precio de cierre (close)
+    v: float  # Volumen negociado
+    n: int  # Número de operaciones en el periodo
+    vw: float  # Precio medio ponderado por volumen (VWAP)
+    t: datetime  # Fecha/hora del bar (ISO 8601 en el JSON)
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "c": 96488.828,
-                    "h": 97443.364467005,
-                    "l": 94146.5695,
-                    "n": 323,
-                    "o": 94146.5695,
-                    "t": "2025-05-01T00:00:00Z",
-                    "v": 1.773802489,
-                    "vw": 96283.1373735878,
-                }
-            ]
-        }
-    }
 
-
-class AlpacaCryptoBarsResponse(BaseModel):
-    """Respuesta principal de la API de crypto bars de Alpaca.
+class AlpacaCryptoBarsData(TypedDict):
+    """Respuesta de crypto bars de Alpaca, indexada por símbolo.
 
     El campo `bars` es un diccionario donde la clave es el símbolo (ej. "BTC/USD")
     y el valor es la lista de barras para ese símbolo.
     """
 
-    bars: Dict[str, List[AlpacaCryptoBar]] = Field(
-        ..., description="Diccionario de símbolos a lista de barras de precio"
-    )
+    bars: Dict[str, List[AlpacaCryptoBarData]]
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "bars": {
-                        "BTC/USD": [
-                            {
-                                "c": 96488.828,
-                                "h": 97443.364467005,
-                                "l": 94146.5695,
-                                "n": 323,
-                                "o": 94146.5695,
-                                "t": "2025-05-01T00:00:00Z",
-                                "v": 1.773802489,
-                                "vw": 96283.1373735878,
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
-    }
 
+# Adapter precompilado: valida el JSON crudo directamente en pydantic-core
+# y devuelve dicts, sin instanciar un modelo por cada barra.
+BARS_RESPONSE_ADAPTER = TypeAdapter(AlpacaCryptoBarsData)
@@ -1,98 +1,44 @@
+"""Modelos `msgspec` de la API de noticias de Alpaca.
+
+Se decodifican con `msgspec.json.decode` en una sola pasada (bytes JSON ->
+objetos tipados). Son los tipos que devuelve `AlpacaNewsClient.get_news`.
+"""
+
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+import msgspec
 
 
-class AlpacaNewsImage(BaseModel):
+class AlpacaNewsImage(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Imagen asociada a una noticia de Alpaca."""
 
-    size: str = Field(..., description="Tamaño de la imagen (large, small, thumb, etc.)")
-    url: HttpUrl = Field(..., description="URL de la imagen")
+    size: str
+    url: str
 
 
-class AlpacaNewsItem(BaseModel):
+class AlpacaNewsItem(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Elemento individual de noticia devuelto por la API de Alpaca."""
 
-    id: int = Field(..., description="Identificador único de la noticia")
-    author: Optional[str] = Field(None, description="Autor de la noticia")
-    content: Optional[str] = Field(None, description="Contenido completo de la noticia, si está disponible")
-    created_at: datetime = Field(..., description="Fecha de creación de la noticia")
-    updated_at: Optional[datetime] = Field(None, description="Fecha de última actualización de la noticia")
-    headline: str = Field(..., description="Titular de la noticia")
-    source: Optional[str] = Field(None, description="Fuente de la noticia")
-    summary: Optional[str] = Field(None, description="Resumen de la noticia")
-    symbols: List[str] = Field(default_factory=list, description="Símbolos relacionados con la noticia")
-    url: Optional[HttpUrl] = Field(None, description="URL pública de la noticia")
-    images: List[AlpacaNewsImage] = Field(
-        default_factory=list, description="Listado de imágenes asociadas a la noticia"
-    )
-
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": 47929778,
-                    "author": "Benzinga Newsdesk",
-                    "content": "",
-                    "created_at": "2025-09-29T20:40:00Z",
-                    "updated_at": "2025-09-29T20:40:01Z",
-                    "headline": "Eric Trump Declares Bitcoin 'The Future' As Shorts Get Liquidated For $83 Million",
-                    "source": "benzinga",
-                    "summary": "Bitcoin (CRYPTO: BTC) has surged above $114,000...",
-                    "symbols": ["ABTC", "BTCUSD"],
-                    "url": "https://www.benzinga.com/crypto/cryptocurrency/25/09/47929778/eric-trump-declares-bitcoin-the-future-as-shorts-get-liquidated-for-83-million",
-                    "images": [
-                        {
-                            "size": "large",
-                            "url": "https://cdn.benzinga.com/files/imagecache/2048x1536xUP/images/story/2025/09/29/Eric-Trump_0.jpeg",
-                        }
-                    ],
-                }
-            ]
-        },
-        "extra": "ignore",
-    }
+    id: int
+    author: Optional[str] = None
+    content: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    headline: str
+    source: Optional[str] = None
+    summary: Optional[str] = None
+    symbols: List[str] = msgspec.field(default_factory=list)
+    url: Optional[str] = None
+    images: List[AlpacaNewsImage] = msgspec.field(default_factory=list)
 
 
-class AlpacaNewsResponse(BaseModel):
+class AlpacaNewsResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Respuesta principal de la API de noticias de Alpaca."""
 
-    news: List[AlpacaNewsItem] = Field(
-        default_factory=list, description="Listado de noticias devueltas por la API"
-    )
-    next_page_token: Optional[str] = Field(
-        None, description="Token para paginar y obtener la siguiente página de resultados"
-    )
+    news: List[AlpacaNewsItem] = msgspec.field(default_factory=list)
+    next_page_token: Optional[str] = None
 
-    model_config = {
-        "extra": "ignore",
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "news": [
-                        {
-                            "id": 47929778,
-                            "author": "Benzinga Newsdesk",
-                            "content": "",
-                            "created_at": "2025-09-29T20:40:00Z",
-                            "updated_at": "2025-09-29T20:40:01Z",
-                            "headline": "Eric Trump Declares Bitcoin 'The Future' As Shorts Get Liquidated For $83 Million",
-                            "source": "benzinga",
-                            "summary": "Bitcoin (CRYPTO: BTC) has surged above $114,000...",
-                            "symbols": ["ABTC", "BTCUSD"],
-                            "url": "https://www.benzinga.com/crypto/cryptocurrency/25/09/47929778/eric-trump-declares-bitcoin-the-future-as-shorts-get-liquidated-for-83-million",
-                            "images": [
-                                {
-                                    "size": "large",
-                                    "url": "https://cdn.benzinga.com/files/imagecache/2048x1536xUP/images/story/2025/09/29/Eric-Trump_0.jpeg",
-                                }
-                            ],
-                        }
-                    ],
-                    "next_page_token": "MTc1OTE3ODQwMTAwMDAwMDAwMHw0NzkyOTc3OA==",
-                }
-            ]
-        },
-    }
 
+# Decoder reutilizable (evita reconstruir el tipo en cada respuesta)
+news_response_decoder = msgspec.json.Decoder(AlpacaNewsResponse)
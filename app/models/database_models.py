@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DECIMAL, BigInteger, Index, String, Text, TIMESTAMP
+from sqlalchemy import DECIMAL, BigInteger, Enum, Index, String, Text, TIMESTAMP, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -15,6 +15,14 @@ class Base(DeclarativeBase):
     pass
 
 
+# Valores válidos de transactions.action (ENUM nativo en MySQL: 1 byte por
+# fila y comparaciones por índice en lugar de VARCHAR)
+TRANSACTION_ACTIONS = ("buy", "sell")
+
+# Las columnas DECIMAL se leen como float (asdecimal=False): el bot opera con
+# floats y así se evita crear un `Decimal` por valor en cada lectura/agregación.
+
+
 class SupportResistanceZone(Base):
     """Modelo para la tabla support_resistance_zones.
 
@@ -24,18 +32,22 @@ class SupportResistanceZone(Base):
     __tablename__ = "support_resistance_zones"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    symbol: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
-    type: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
-    price: Mapped[float] = mapped_column(DECIMAL(18, 2), nullable=False)
+    symbol: Mapped[str] = mapped_column(String(20), nullable=False)
+    type: Mapped[str] = mapped_column(String(20), nullable=False)
+    price: Mapped[float] = mapped_column(DECIMAL(18, 2, asdecimal=False), nullable=False)
     strength: Mapped[str] = mapped_column(String(20), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Los repositorios fijan created_at en UTC al crear la fila (sin RETURNING en
+    # MySQL un default de servidor quedaría expirado tras el flush); el default
+    # UTC_TIMESTAMP() solo cubre inserts que lo omiten
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP, nullable=False, default=lambda: datetime.now(timezone.utc), index=True
+        TIMESTAMP, nullable=False, server_default=text("(UTC_TIMESTAMP())")
     )
 
-    # Índices adicionales definidos en __table_args__
+    # Índices definidos solo en __table_args__ (sin index=True en las columnas
+    # para no duplicarlos). idx_symbol_created_at también cubre búsquedas por symbol.
     __table_args__ = (
-        Index("idx_symbol", "symbol"),
+        Index("idx_symbol_created_at", "symbol", "created_at"),
         Index("idx_type", "type"),
         Index("idx_created_at", "created_at"),
     )
@@ -56,24 +68,31 @@ class Transaction(Base):
     __tablename__ = "transactions"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    symbol: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
-    action: Mapped[str] = mapped_column(String(10), nullable=False)  # "buy" o "sell"
-    quantity: Mapped[float] = mapped_column(DECIMAL(18, 8), nullable=False)
-    price: Mapped[float] = mapped_column(DECIMAL(18, 2), nullable=False)
-    total: Mapped[float] = mapped_column(DECIMAL(18, 2), nullable=False)
-    portfolio_value: Mapped[Optional[float]] = mapped_column(DECIMAL(18, 2), nullable=True)
-    available_usd: Mapped[Optional[float]] = mapped_column(DECIMAL(18, 2), nullable=True)
-    pnl: Mapped[Optional[float]] = mapped_column(DECIMAL(18, 2), nullable=True)
+    symbol: Mapped[str] = mapped_column(String(20), nullable=False)
+    action: Mapped[str] = mapped_column(
+        Enum(*TRANSACTION_ACTIONS, name="transaction_action"), nullable=False
+    )
+    quantity: Mapped[float] = mapped_column(DECIMAL(18, 8, asdecimal=False), nullable=False)
+    price: Mapped[float] = mapped_column(DECIMAL(18, 2, asdecimal=False), nullable=False)
+    total: Mapped[float] = mapped_column(DECIMAL(18, 2, asdecimal=False), nullable=False)
+    portfolio_value: Mapped[Optional[float]] = mapped_column(DECIMAL(18, 2, asdecimal=False), nullable=True)
+    available_usd: Mapped[Optional[float]] = mapped_column(DECIMAL(18, 2, asdecimal=False), nullable=True)
+    pnl: Mapped[Optional[float]] = mapped_column(DECIMAL(18, 2, asdecimal=False), nullable=True)
     reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Fijado en UTC por buy()/sell(); UTC_TIMESTAMP() cubre bulk_insert y
+    # cualquier insert que lo omita
     created_at: Mapped[Optional[datetime]] = mapped_column(
-        TIMESTAMP, nullable=True, default=lambda: datetime.now(timezone.utc), index=True
+        TIMESTAMP, nullable=True, server_default=text("(UTC_TIMESTAMP())")
     )
     agent_name: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
-    # Índices adicionales
+    # Índices definidos solo en __table_args__ (sin index=True en las columnas
+    # para no duplicarlos). idx_symbol_created_at también cubre búsquedas por symbol.
     __table_args__ = (
-        Index("idx_symbol", "symbol"),
+        Index("idx_symbol_created_at", "symbol", "created_at"),
         Index("idx_created_at", "created_at"),
+        # Cubre get_pnl_summary (action + rango de fechas + pnl) sin tocar la tabla
+        Index("idx_action_created_at_pnl", "action", "created_at", "pnl"),
     )
 
     def __repr__(self) -> str:
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import List, Literal
+from typing import Literal, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import FastModel
 
-class ExecutorDecision(BaseModel):
+
+class ExecutorDecision(FastModel):
     """Decisión estructurada del Agente 3: El Juez de Riesgo (The Executor)."""
 
     final_decision: Literal["buy", "sell", "hold"] = Field(
@@ -21,21 +23,21 @@ class ExecutorDecision(BaseModel):
         description="Razonamiento completo y equilibrado de la decisión (mínimo 100 caracteres)",
     )
 
-    strategist_points_accepted: List[str] = Field(
+    strategist_points_accepted: Tuple[str, ...] = Field(
         ...,
         min_length=1,
         max_length=5,
         description="Argumentos del Estratega que el Juez considera válidos (1-5)",
     )
 
-    skeptic_points_accepted: List[str] = Field(
+    skeptic_points_accepted: Tuple[str, ...] = Field(
         ...,
         min_length=1,
         max_length=5,
         description="Argumentos del Abogado del Diablo que el Juez considera válidos (1-5)",
     )
 
-    key_factors_for_decision: List[str] = Field(
+    key_factors_for_decision: Tuple[str, ...] = Field(
         ...,
         min_length=2,
         max_length=5,
@@ -58,6 +60,7 @@ class ExecutorDecision(BaseModel):
     )
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
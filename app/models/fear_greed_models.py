@@ -1,9 +1,12 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import FastModel
+from app.models._openapi import openapi_examples
 
-class FearGreedValue(BaseModel):
+
+class FearGreedValue(FastModel):
     """Valor individual del índice Fear & Greed para una fecha concreta."""
 
     value: int = Field(..., description="Valor numérico del índice (0-100)")
@@ -16,21 +19,10 @@ class FearGreedValue(BaseModel):
         description="Tiempo restante hasta la próxima actualización, si está disponible",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "value": 74,
-                    "value_classification": "Greed",
-                    "timestamp": "1766534400",
-                    "time_until_update": "86400",
-                }
-            ]
-        }
-    }
-
-
-class FearGreedResponse(BaseModel):
+    model_config = {"frozen": True, **openapi_examples("FEAR_GREED_VALUE")}
+
+
+class FearGreedResponse(FastModel):
     """Respuesta principal del índice Fear & Greed."""
 
     name: Optional[str] = Field(
@@ -41,21 +33,5 @@ class FearGreedResponse(BaseModel):
         description="Lista de valores del índice ordenados por fecha",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "Crypto Fear and Greed Index",
-                    "data": [
-                        {
-                            "value": 74,
-                            "value_classification": "Greed",
-                            "timestamp": "1766534400",
-                            "time_until_update": "86400",
-                        }
-                    ],
-                }
-            ]
-        }
-    }
+    model_config = openapi_examples("FEAR_GREED_RESPONSE")
 
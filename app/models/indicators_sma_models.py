@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import Field
 
+from app.models._base import FastModel
+from app.models._openapi import openapi_examples
 
-class IndicatorValue(BaseModel):
+
+class IndicatorValue(FastModel):
     """Valor individual de un indicador técnico en un timestamp concreto."""
 
     timestamp: int = Field(
@@ -11,24 +14,18 @@ class IndicatorValue(BaseModel):
     )
     value: float = Field(..., description="Valor calculado del indicador (por ejemplo, SMA)")
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {"timestamp": 1766534400000, "value": 107716.27114999991}
-            ]
-        }
-    }
+    model_config = {"frozen": True, **openapi_examples("INDICATOR_VALUE")}
 
 
-class IndicatorUnderlying(BaseModel):
+class IndicatorUnderlying(FastModel):
     """Información sobre la serie subyacente usada para el cálculo del indicador."""
 
-    url: HttpUrl = Field(
+    url: str = Field(
         ..., description="URL de la serie de datos subyacente usada para el cálculo"
     )
 
 
-class IndicatorResults(BaseModel):
+class IndicatorResults(FastModel):
     """Resultados de un indicador técnico (como una media móvil simple)."""
 
     underlying: IndicatorUnderlying = Field(
@@ -39,53 +36,46 @@ class IndicatorResults(BaseModel):
         description="Lista de valores calculados del indicador",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "underlying": {
-                        "url": "https://api.polygon.io/v2/aggs/ticker/X:BTCUSD/range/1/day/1483246800000/1766696751877?limit=894&sort=desc"
-                    },
-                    "values": [
-                        {"timestamp": 1766534400000, "value": 107716.27114999991}
-                    ],
-                }
-            ]
-        }
-    }
-
-
-class IndicatorResponse(BaseModel):
+    model_config = openapi_examples("INDICATOR_RESULTS")
+
+
+class IndicatorResponse(FastModel):
     """Respuesta principal de una consulta de indicador técnico (por ejemplo, SMA)."""
 
     results: IndicatorResults = Field(..., description="Resultados del indicador")
     status: str = Field(..., description="Estado de la respuesta (ej. 'OK')")
     request_id: Optional[str] = Field(None, description="Identificador de la petición")
-    next_url: Optional[HttpUrl] = Field(
+    next_url: Optional[str] = Field(
         None,
         description="URL para obtener la siguiente página de resultados, si existe",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "results": {
-                        "underlying": {
-                            "url": "https://api.polygon.io/v2/aggs/ticker/X:BTCUSD/range/1/day/1483246800000/1766696751877?limit=894&sort=desc"
-                        },
-                        "values": [
-                            {
-                                "timestamp": 1766534400000,
-                                "value": 107716.27114999991,
-                            }
-                        ],
-                    },
-                    "status": "OK",
-                    "request_id": "a16d479046da5eb609d9f698453ea6e2",
-                    "next_url": "https://api.polygon.io/v1/indicators/sma/X:BTCUSD?cursor=...",
-                }
-            ]
-        }
-    }
+    @classmethod
+    def from_api(cls, payload: Dict[str, Any]) -> "IndicatorResponse":
+        """Construye la respuesta desde el JSON de la API sin validación Pydantic.
+
+        Ruta rápida para datos confiables del proveedor: usa `model_construct`
+        en todos los niveles. Para validación completa usar `model_validate`.
+
+        Args:
+            payload: JSON decodificado del endpoint de indicadores.
+
+        Returns:
+            IndicatorResponse: Respuesta con los modelos anidados construidos.
+        """
+        results = payload["results"]
+        return cls.model_construct(
+            results=IndicatorResults.model_construct(
+                underlying=IndicatorUnderlying.model_construct(**results["underlying"]),
+                values=[
+                    IndicatorValue.model_construct(**value)
+                    for value in results.get("values") or []
+                ],
+            ),
+            status=payload["status"],
+            request_id=payload.get("request_id"),
+            next_url=payload.get("next_url"),
+        )
+
+    model_config = openapi_examples("INDICATOR_RESPONSE")
 
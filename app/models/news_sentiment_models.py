@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import FastModel
 
-class NewsSentimentAnalysis(BaseModel):
+
+class NewsSentimentAnalysis(FastModel):
     """Respuesta estructurada del LLM para análisis de sentimiento de noticias."""
 
     context_summary: str = Field(
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import List, Literal
+from typing import Literal, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import Field
 
+from app.models._base import FastModel
 
-class SkepticCritique(BaseModel):
+
+class SkepticCritique(FastModel):
     """Crítica estructurada del Agente 2: El Abogado del Diablo (The Skeptic)."""
 
     overall_assessment: Literal["reject", "proceed_with_caution", "acceptable"] = Field(
@@ -21,18 +23,20 @@ class SkepticCritique(BaseModel):
         description="Crítica principal y mordaz de la propuesta (mínimo 100 caracteres)",
     )
 
-    identified_risks: List[str] = Field(
+    identified_risks: Tuple[str, ...] = Field(
         ...,
+        min_length=3,
+        max_length=7,
         description="Lista de 3-7 riesgos específicos identificados",
     )
 
-    contradictions: List[str] = Field(
-        default_factory=list,
+    contradictions: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Contradicciones encontradas en el análisis del Estratega",
     )
 
-    missing_considerations: List[str] = Field(
-        default_factory=list,
+    missing_considerations: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Factores importantes que el Estratega ignoró o minimizó",
     )
 
@@ -42,17 +46,8 @@ class SkepticCritique(BaseModel):
         description="Recomendación final del Abogado del Diablo",
     )
 
-    @field_validator("identified_risks")
-    @classmethod
-    def validate_risks_length(cls, v: List[str]) -> List[str]:
-        """Valida que haya entre 3 y 7 riesgos identificados."""
-        if len(v) < 3:
-            raise ValueError("Debe haber al menos 3 riesgos identificados")
-        if len(v) > 7:
-            raise ValueError("No debe haber más de 7 riesgos identificados")
-        return v
-
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
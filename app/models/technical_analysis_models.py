@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from app.models._base import FastModel
 
-class TechnicalAnalysis(BaseModel):
+
+class TechnicalAnalysis(FastModel):
     """Respuesta estructurada del LLM para análisis técnico basado en SMAs."""
 
     trend_analysis: str = Field(
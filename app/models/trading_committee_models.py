@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import List, Literal
+from typing import Annotated, Any, Literal, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Discriminator, Field, Tag
 
+from app.models._base import FastModel
+from app.models.executor_models import ExecutorDecision
+from app.models.skeptic_models import SkepticCritique
 
-class StrategistProposal(BaseModel):
+
+class StrategistProposal(FastModel):
     """Propuesta estructurada del Agente 1: El Estratega (The Opportunist)."""
 
     direction: Literal["buy", "sell", "hold"] = Field(
@@ -24,25 +28,18 @@ class StrategistProposal(BaseModel):
         min_length=50,
         description="Justificación completa de por qué el contexto favorece el movimiento (mínimo 50 caracteres)",
     )
-    key_factors: List[str] = Field(
+    key_factors: Tuple[str, ...] = Field(
         ...,
+        min_length=2,
+        max_length=5,
         description="Lista de 2-5 factores clave que apoyan la propuesta",
     )
     confidence_level: Literal["high", "medium", "low"] = Field(
         ..., description="Nivel de confianza en la propuesta"
     )
 
-    @field_validator("key_factors")
-    @classmethod
-    def validate_key_factors_length(cls, v: List[str]) -> List[str]:
-        """Valida que haya entre 2 y 5 factores clave."""
-        if len(v) < 2:
-            raise ValueError("Debe haber al menos 2 factores clave")
-        if len(v) > 5:
-            raise ValueError("No debe haber más de 5 factores clave")
-        return v
-
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -61,3 +58,36 @@ class StrategistProposal(BaseModel):
         }
     }
 
+
+def _committee_output_kind(v: Any) -> Optional[str]:
+    """Identifica qué agente produjo una salida del Trading Committee.
+
+    Contrato del discriminador: cada modelo tiene un campo `Literal` propio que
+    lo identifica (`direction` → Estratega, `overall_assessment` → Escéptico,
+    `final_decision` → Juez), así que no hace falta un campo `kind` extra en
+    el schema que recibe el LLM.
+    """
+    if isinstance(v, BaseModel):
+        v = type(v).model_fields
+    elif not isinstance(v, dict):
+        return None
+    if "final_decision" in v:
+        return "executor"
+    if "overall_assessment" in v:
+        return "skeptic"
+    if "direction" in v:
+        return "strategist"
+    return None
+
+
+# Unión etiquetada para contenedores que embeben salidas de varios agentes:
+# pydantic valida directamente contra el modelo correcto en lugar de probar
+# cada variante en orden.
+CommitteeOutput = Annotated[
+    Union[
+        Annotated[StrategistProposal, Tag("strategist")],
+        Annotated[SkepticCritique, Tag("skeptic")],
+        Annotated[ExecutorDecision, Tag("executor")],
+    ],
+    Discriminator(_committee_output_kind),
+]
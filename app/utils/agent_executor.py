@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from pydantic import BaseModel, ValidationError
@@ -28,16 +29,38 @@ class AgentExecutorError(Exception):
 
     pass
 
+
+@lru_cache(maxsize=32)
+def _get_structured_llm(response_model: Type[BaseModel]):
+    """Devuelve el LLM con structured output para un modelo (cacheado por clase).
+
+    `with_structured_output` genera el JSON schema del modelo; se hace una sola
+    vez por `response_model` en lugar de en cada request.
+    """
+    return get_llm().with_structured_output(response_model)
+
+
+def warmup_structured_outputs(models: Iterable[Type[BaseModel]]) -> None:
+    """Precalienta el cliente LLM y el structured output de cada modelo.
+
+    Llena la cache de `_get_structured_llm` para que la primera ejecución de
+    cada agente no pague la creación del cliente ni la generación del schema.
+
+    Args:
+        models: `response_model` de los agentes a precalentar.
+    """
+    for response_model in models:
+        _get_structured_llm(response_model)
+
+
 class AgentExecutor:
     """Service for executing LLM requests with structured outputs."""
 
     @staticmethod
     async def execute(system_prompt: str, user_prompt: str,  response_model: Type[T],  context: Optional[Dict[str, Any]] = None,) -> T:
         """Execute an LLM request with structured output."""
-        context_str = f" [{context}]" if context else ""
-        logger.debug(f"Ejecutando LLM{context_str}")
-        llm = get_llm()
-        structured_llm = llm.with_structured_output(response_model)
+        logger.debug("Ejecutando LLM %s", context or "")
+        structured_llm = _get_structured_llm(response_model)
 
         messages = [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
 
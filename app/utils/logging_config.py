@@ -0,0 +1,30 @@
+"""Configuración de logging compartida por la API y los scripts."""
+
+import logging
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Formatter único, reutilizado por todos los handlers que instalamos
+_FORMATTER = logging.Formatter(LOG_FORMAT)
+
+_handler: logging.Handler | None = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Instala un único StreamHandler en el logger raíz.
+
+    Es idempotente: llamadas repetidas (scripts, tests, recargas) solo
+    ajustan el nivel sin volver a crear el handler ni el formatter.
+
+    Args:
+        level: Nivel mínimo del logger raíz.
+    """
+    global _handler
+
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    if _handler is None:
+        _handler = logging.StreamHandler()
+        _handler.setFormatter(_FORMATTER)
+        root.addHandler(_handler)
@@ -2,148 +2,287 @@
 
 Este módulo configura la ejecución programada del grafo de trading
 dos veces al día: 9:00 AM y 6:00 PM.
+
+En lugar de dos CronTriggers permanentes se mantiene un único job con
+`DateTrigger` para la próxima ejecución. Un listener de eventos del scheduler
+re-arma el siguiente horario cuando el job termina, falla o se pierde por
+misfire, así el ciclo nunca queda sin job pendiente.
 """
 
+import asyncio
 import logging
-from typing import List
-
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+from zoneinfo import ZoneInfo
+
+import msgspec
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MISSED,
+    JobExecutionEvent,
+)
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 
 from app.agent.graph.trading_graph import run_trading_analysis
+from app.agent.state.agent_state import AgentState
 
 logger = logging.getLogger(__name__)
 
-# Singleton del scheduler
-_scheduler: AsyncIOScheduler | None = None
+# Encoder JSON reutilizable para los logs estructurados del análisis programado
+_log_encoder = msgspec.json.Encoder()
+
+# Zona horaria de las ejecuciones programadas (se resuelve una sola vez)
+_TZ = ZoneInfo("America/Argentina/Buenos_Aires")
+
+# Horarios diarios de ejecución (hora local) y nombre del job correspondiente
+_SCHEDULE_HOURS: Dict[int, str] = {
+    9: "Análisis de Trading - Mañana",
+    18: "Análisis de Trading - Tarde",
+}
+_NEXT_JOB_ID = "trading_analysis_next"
 
 
-async def _execute_scheduled_analysis(symbols: List[str], news_limit: int) -> None:
-    """Ejecuta el análisis de trading programado.
+def _next_run_time(now: datetime) -> Tuple[datetime, str]:
+    """Calcula el próximo horario programado estrictamente posterior a `now`.
 
     Args:
-        symbols: Lista de símbolos a analizar.
-        news_limit: Límite de noticias a analizar.
+        now: Fecha/hora actual (con zona horaria del scheduler).
+
+    Returns:
+        Tupla (fecha/hora de la próxima ejecución, nombre del job).
     """
-    logger.info(f"🤖 Ejecutando análisis programado para {symbols}")
+    for hour, name in sorted(_SCHEDULE_HOURS.items()):
+        candidate = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if candidate > now:
+            return candidate, name
 
-    try:
-        final_state = await run_trading_analysis(
-            symbols=symbols,
-            news_limit=news_limit,
+    first_hour, first_name = min(_SCHEDULE_HOURS.items())
+    tomorrow = now + timedelta(days=1)
+    return tomorrow.replace(hour=first_hour, minute=0, second=0, microsecond=0), first_name
+
+
+def _log_event(level: int, event: str, exc_info: bool = False, **fields: Any) -> None:
+    """Emite un log estructurado en JSON (una línea por evento).
+
+    El payload solo se serializa si el nivel está habilitado.
+
+    Args:
+        level: Nivel de logging (`logging.INFO`, `logging.ERROR`, ...).
+        event: Nombre del evento (p. ej. "scheduled_run_start").
+        exc_info: Adjuntar la excepción en curso al registro.
+        **fields: Campos adicionales del evento (serializables a JSON).
+    """
+    if logger.isEnabledFor(level):
+        logger.log(
+            level,
+            _log_encoder.encode({"event": event, **fields}).decode(),
+            exc_info=exc_info,
         )
 
-        # Log del resultado
-        if final_state.get("error_message"):
-            logger.error(
-                f"❌ Análisis programado falló: {final_state['error_message']}"
-            )
-        else:
-            # Log de la decisión del ejecutor
-            executor_decision = final_state.get("executor_decision", "N/A")
-            executor_reasoning = final_state.get("executor_reasoning", "N/A")
 
-            logger.info(
-                f"✅ Análisis programado completado - Decisión: {executor_decision.upper()}"
-            )
-            logger.info(f"📊 Razonamiento: {executor_reasoning[:200]}...")
+def _log_result(final_state: AgentState) -> None:
+    """Registra el resultado de un análisis programado.
 
-    except Exception as exc:
-        logger.error(
-            f"❌ Error ejecutando análisis programado: {exc}",
-            exc_info=True,
+    Args:
+        final_state: Estado final devuelto por el grafo de trading.
+    """
+    if final_state.get("error_message"):
+        _log_event(
+            logging.ERROR,
+            "scheduled_run_failed",
+            error=final_state["error_message"],
         )
+        return
 
+    # Log de la decisión del ejecutor
+    _log_event(
+        logging.INFO,
+        "scheduled_run_completed",
+        decision=final_state.get("executor_decision", "N/A").upper(),
+        reasoning=final_state.get("executor_reasoning", "N/A")[:200],
+    )
 
-def start_scheduler() -> None:
-    """Inicia el scheduler de análisis automático.
 
-    Configura dos ejecuciones diarias:
-    - 9:00 AM
-    - 6:00 PM
+class SchedulerService:
+    """Scheduler de análisis automático asociado a una aplicación.
 
-    Los datos de entrada son:
-    - symbols: ["BTCUSD"]
-    - news_limit: 10
+    Cada instancia tiene su propio `AsyncIOScheduler` y su propio guard de
+    concurrencia, de modo que varias apps (o tests) en un mismo proceso no
+    comparten estado. La instancia se guarda en `app.state.scheduler`.
     """
-    global _scheduler
 
-    if _scheduler is not None:
-        logger.warning("⚠️ Scheduler ya está iniciado")
-        return
+    def __init__(
+        self,
+        symbols: List[str] | None = None,
+        news_limit: int = 10,
+        tz: ZoneInfo = _TZ,
+    ) -> None:
+        """Inicializa el servicio sin arrancar el scheduler.
+
+        Args:
+            symbols: Símbolos a analizar (por defecto ["BTCUSD"]).
+            news_limit: Límite de noticias a analizar.
+            tz: Zona horaria de los horarios programados.
+        """
+        self.symbols = symbols or ["BTCUSD"]
+        self.news_limit = news_limit
+        self._tz = tz
+        # El scheduler duerme hasta el próximo run; si el jobstore falla, reintenta
+        # cada minuto en lugar de cada 10 s
+        self._scheduler = AsyncIOScheduler(timezone=tz, jobstore_retry_interval=60)
+        # Garantiza que solo un análisis programado se ejecute a la vez
+        self._inflight = asyncio.Semaphore(1)
+        # Re-armar el próximo horario al terminar, fallar o perderse el job actual
+        self._scheduler.add_listener(
+            self._on_job_event,
+            EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED,
+        )
 
-    # Crear scheduler
-    _scheduler = AsyncIOScheduler(timezone="America/Argentina/Buenos_Aires")
-
-    # Parámetros de análisis
-    symbols = ["BTCUSD"]
-    news_limit = 10
-
-    # Job 1: Análisis a las 9:00 AM
-    _scheduler.add_job(
-        _execute_scheduled_analysis,
-        trigger=CronTrigger(hour=9, minute=0),
-        args=[symbols, news_limit],
-        id="trading_analysis_morning",
-        name="Análisis de Trading - Mañana",
-        replace_existing=True,
-    )
+    def _schedule_next(self) -> None:
+        """Programa (o reemplaza) el único job pendiente para el próximo horario."""
+        self._arm(*_next_run_time(datetime.now(self._tz)))
+
+    def _arm(self, run_date: datetime, name: str) -> None:
+        """Programa (o reemplaza) el único job pendiente para `run_date`.
+
+        Args:
+            run_date: Fecha/hora de la ejecución.
+            name: Nombre descriptivo del job.
+        """
+        self._scheduler.add_job(
+            self._execute,
+            trigger=DateTrigger(run_date=run_date, timezone=self._tz),
+            id=_NEXT_JOB_ID,
+            name=name,
+            replace_existing=True,
+            # Si el proceso estuvo suspendido, ejecutar una sola vez dentro de 15 min
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=900,
+        )
 
-    # Job 2: Análisis a las 6:00 PM
-    _scheduler.add_job(
-        _execute_scheduled_analysis,
-        trigger=CronTrigger(hour=18, minute=0),
-        args=[symbols, news_limit],
-        id="trading_analysis_evening",
-        name="Análisis de Trading - Tarde",
-        replace_existing=True,
-    )
+    def _on_job_event(self, event: JobExecutionEvent) -> None:
+        """Re-arma el próximo horario cuando el job pendiente se consume.
+
+        Se dispara también con `EVENT_JOB_MISSED`: si el proceso estuvo
+        suspendido más que `misfire_grace_time`, APScheduler descarta el
+        `DateTrigger` sin ejecutar el job y sin este listener no quedaría
+        ninguna ejecución programada.
+
+        Args:
+            event: Evento de ejecución emitido por APScheduler.
+        """
+        if event.job_id != _NEXT_JOB_ID or not self._scheduler.running:
+            return
+
+        if event.code == EVENT_JOB_MISSED:
+            _log_event(
+                logging.WARNING,
+                "scheduled_run_missed",
+                scheduled_for=event.scheduled_run_time.isoformat(),
+            )
 
-    # Iniciar scheduler
-    _scheduler.start()
+        self._schedule_next()
 
-    logger.info("✅ Scheduler iniciado - Ejecuciones programadas:")
-    logger.info("   📅 9:00 AM - Análisis matutino")
-    logger.info("   📅 6:00 PM - Análisis vespertino")
+    async def _execute(self) -> None:
+        """Ejecuta el análisis de trading programado.
 
+        Si ya hay un análisis en curso la invocación se descarta en lugar de
+        encolarse, para no duplicar la carga sobre la base de datos y el LLM.
+        """
+        if self._inflight.locked():
+            _log_event(logging.WARNING, "scheduled_run_skipped", reason="already_running")
+            return
 
-def stop_scheduler() -> None:
-    """Detiene el scheduler de análisis automático."""
-    global _scheduler
+        async with self._inflight:
+            await _run_scheduled_analysis(self.symbols, self.news_limit)
 
-    if _scheduler is None:
-        logger.warning("⚠️ Scheduler no está iniciado")
-        return
+    def start(self) -> None:
+        """Inicia el scheduler de análisis automático.
 
-    _scheduler.shutdown(wait=True)
-    _scheduler = None
+        Configura dos ejecuciones diarias:
+        - 9:00 AM
+        - 6:00 PM
+        """
+        if self._scheduler.running:
+            logger.warning("⚠️ Scheduler ya está iniciado")
+            return
 
-    logger.info("🛑 Scheduler detenido correctamente")
+        # Un único job con la próxima ejecución (9:00 AM o 6:00 PM)
+        self._schedule_next()
 
+        self._scheduler.start()
 
-def get_scheduler_status() -> dict:
-    """Obtiene el estado actual del scheduler.
+        logger.info("✅ Scheduler iniciado - Ejecuciones programadas:")
+        logger.info("   📅 9:00 AM - Análisis matutino")
+        logger.info("   📅 6:00 PM - Análisis vespertino")
+
+    def stop(self) -> None:
+        """Detiene el scheduler de análisis automático."""
+        if not self._scheduler.running:
+            logger.warning("⚠️ Scheduler no está iniciado")
+            return
+
+        self._scheduler.shutdown(wait=True)
+
+        logger.info("🛑 Scheduler detenido correctamente")
+
+    def status(self) -> dict:
+        """Obtiene el estado actual del scheduler.
+
+        Returns:
+            dict: Información sobre el scheduler y sus jobs.
+        """
+        if not self._scheduler.running:
+            return {
+                "running": False,
+                "jobs": [],
+            }
+
+        jobs = [
+            {
+                "id": job.id,
+                "name": job.name,
+                "next_run": next_run.isoformat() if (next_run := job.next_run_time) else None,
+            }
+            for job in self._scheduler.get_jobs()
+        ]
 
-    Returns:
-        dict: Información sobre el scheduler y sus jobs.
-    """
-    if _scheduler is None:
         return {
-            "running": False,
-            "jobs": [],
+            "running": True,
+            "jobs": jobs,
         }
 
-    jobs = []
-    for job in _scheduler.get_jobs():
-        next_run = job.next_run_time.isoformat() if job.next_run_time else None
-        jobs.append({
-            "id": job.id,
-            "name": job.name,
-            "next_run": next_run,
-        })
 
-    return {
-        "running": _scheduler.running,
-        "jobs": jobs,
-    }
+async def _run_scheduled_analysis(symbols: List[str], news_limit: int) -> None:
+    """Ejecuta el análisis y registra su resultado.
+
+    Args:
+        symbols: Lista de símbolos a analizar.
+        news_limit: Límite de noticias a analizar.
+    """
+    _log_event(
+        logging.INFO,
+        "scheduled_run_start",
+        symbols=symbols,
+        news_limit=news_limit,
+    )
+
+    try:
+        final_state = await run_trading_analysis(
+            symbols=symbols,
+            news_limit=news_limit,
+        )
+
+        # El formateo/escritura del log se hace fuera del event loop
+        await asyncio.to_thread(_log_result, final_state)
 
+    except Exception as exc:
+        _log_event(
+            logging.ERROR,
+            "scheduled_run_error",
+            exc_info=True,
+            error=str(exc),
+        )
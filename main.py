@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -7,19 +8,73 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
+from app.config.settings import settings
 from app.controller.trading import router as trading_router
-from app.database import close_db_connections
-from app.utils.scheduler import start_scheduler, stop_scheduler
+from app.database import close_db_connections, warmup_db_pools
+from app.utils.logging_config import configure_logging
+from app.utils.scheduler import SchedulerService
 
 # Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+configure_logging(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
 
+def _warmup_llm_clients() -> None:
+    """Crea el cliente LLM y los structured outputs de cada agente.
+
+    El grafo de trading ya se compila al importar sus módulos; lo que queda
+    en frío es el cliente de OpenAI y la generación de JSON schema de cada
+    `response_model`, que de otro modo paga la primera ejecución.
+    """
+    from app.models.executor_models import ExecutorDecision
+    from app.models.news_sentiment_models import NewsSentimentAnalysis
+    from app.models.skeptic_models import SkepticCritique
+    from app.models.technical_analysis_models import TechnicalAnalysis
+    from app.models.trading_committee_models import StrategistProposal
+    from app.utils.agent_executor import warmup_structured_outputs
+
+    warmup_structured_outputs(
+        (
+            NewsSentimentAnalysis,
+            TechnicalAnalysis,
+            StrategistProposal,
+            SkepticCritique,
+            ExecutorDecision,
+        )
+    )
+
+
+async def _close_http_clients() -> None:
+    """Cierra los clientes HTTP compartidos y sus pools de conexiones."""
+    from app.clients.alpaca_crypto_bars_client import alpaca_crypto_bars_client
+    from app.clients.alpaca_news_client import alpaca_news_client
+    from app.clients.fear_greed_client import fear_greed_client
+    from app.clients.indicators_sma_client import sma_client
+
+    await asyncio.gather(
+        alpaca_news_client.aclose(),
+        alpaca_crypto_bars_client.aclose(),
+        fear_greed_client.aclose(),
+        sma_client.aclose(),
+        return_exceptions=True,
+    )
+
+
+async def _warmup() -> None:
+    """Precalienta pools de DB y clientes LLM sin bloquear el startup."""
+    try:
+        await warmup_db_pools()
+    except Exception as exc:
+        logger.warning("⚠️ Warmup de pools de base de datos falló: %s", exc)
+
+    try:
+        await asyncio.to_thread(_warmup_llm_clients)
+        logger.info("🔥 Clientes LLM precalentados")
+    except Exception as exc:
+        logger.warning("⚠️ Warmup de clientes LLM falló: %s", exc)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle manager para la aplicación FastAPI.
@@ -31,16 +86,27 @@ async def lifespan(app: FastAPI):
     logger.info("✅ Grafo de trading cargado")
 
     # Iniciar scheduler de análisis automático
-    start_scheduler()
+    app.state.scheduler = SchedulerService()
+    if settings.scheduler_enabled:
+        app.state.scheduler.start()
+    else:
+        logger.info("⏸️ Scheduler deshabilitado (SCHEDULER_ENABLED=false)")
+
+    # Precalentar pools de DB y clientes LLM sin demorar el arranque
+    warmup_task = asyncio.create_task(_warmup())
 
     yield
 
     # Shutdown
     logger.info("🔌 Cerrando conexiones...")
 
+    warmup_task.cancel()
+
     # Detener scheduler
-    stop_scheduler()
+    if settings.scheduler_enabled:
+        app.state.scheduler.stop()
 
+    await _close_http_clients()
     await close_db_connections()
     logger.info("✅ Aplicación cerrada correctamente")
 
@@ -73,13 +139,14 @@ app = FastAPI(
 # Middlewares
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # En producción, especificar orígenes
+    allow_origins=settings.cors_allow_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Compresión rápida (nivel 1) solo para respuestas grandes: corre en el event loop
+app.add_middleware(GZipMiddleware, minimum_size=4096, compresslevel=1)
 
 # Routers
 app.include_router(trading_router)
@@ -119,13 +186,32 @@ async def health() -> dict:
 
 
 if __name__ == "__main__":
+    import os
+    import sys
+
     import uvicorn
 
+    # Autoreload solo en desarrollo (UVICORN_RELOAD=1); es incompatible con workers
+    reload = os.getenv("UVICORN_RELOAD", "0") == "1"
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    # Cada worker levantaría su propio scheduler y el análisis (con sus
+    # operaciones y email) se ejecutaría una vez por worker
+    if workers > 1 and settings.scheduler_enabled:
+        sys.exit(
+            "WEB_CONCURRENCY > 1 requiere SCHEDULER_ENABLED=false; "
+            "ejecutar el scheduler en un proceso aparte"
+        )
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Solo para desarrollo
+        # uvloop no está disponible en Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=reload,
+        workers=workers,
         log_level="info",
     )
 
@@ -5,22 +5,13 @@ import logging
 
 from app.agent.nodes.email_notification_node import send_email_notification_node
 from app.agent.state.agent_state import AgentState
+from app.utils.logging_config import configure_logging
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configurar logging (mismo handler/formatter que la API)
+configure_logging(logging.INFO)
 
-
-async def test_email_notification():
-    """Prueba el envío de email con un estado de ejemplo."""
-
-    # Estado de prueba
-    test_state: AgentState = {
-        "symbols": ["BTCUSD"],
-        "executor_decision": "buy",
-        "executor_decision_text": """
+# Texto de decisión de ejemplo para el email de prueba
+_SAMPLE_DECISION_TEXT = """\
 === DECISIÓN FINAL ===
 
 Después de analizar toda la información disponible, he decidido:
@@ -45,8 +36,17 @@ RIESGOS IDENTIFICADOS:
 - Resistencia en $47,000
 - Posible corrección después de subida
 
-Esta decisión se toma con confianza del 75%.
-        """.strip(),
+Esta decisión se toma con confianza del 75%."""
+
+
+async def test_email_notification():
+    """Prueba el envío de email con un estado de ejemplo."""
+
+    # Estado de prueba
+    test_state: AgentState = {
+        "symbols": ["BTCUSD"],
+        "executor_decision": "buy",
+        "executor_decision_text": _SAMPLE_DECISION_TEXT,
         "news_limit": 10,
     }
 
@@ -74,5 +74,16 @@ Esta decisión se toma con confianza del 75%.
 
 
 if __name__ == "__main__":
-    asyncio.run(test_email_notification())
+    import sys
+
+    # uvloop no está disponible en Windows: usar el loop estándar
+    if sys.platform == "win32":
+        loop_factory = None
+    else:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(test_email_notification())
 